@@ -1199,6 +1199,34 @@ jwplayer("mediaplayer").setup({"abouttext":"Visit Indie DB","aboutlink":"http:\/
                         }
                     ]
                 },
+            ), (
+                # Negative S@r repeats until the next S, i.e. yields a single segment here
+                'segment_timeline_negative_repeat',
+                'http://unknown/manifest.mpd',  # mpd_url
+                None,  # mpd_base_url
+                [{
+                    'format_id': 'video',
+                    'manifest_url': 'http://unknown/manifest.mpd',
+                    'url': 'http://unknown/manifest.mpd',
+                    'ext': 'mp4',
+                    'format_note': 'DASH video',
+                    'container': 'mp4_dash',
+                    'protocol': 'http_dash_segments',
+                    'acodec': 'none',
+                    'vcodec': 'avc1.42c01e',
+                    'tbr': 500,
+                    'width': 640,
+                    'height': 360,
+                    'fps': 25,
+                    'fragments': [
+                        {'path': 'init-video.mp4'},
+                        {'path': 'seg-video-0.m4s', 'duration': 2.0},
+                        {'path': 'seg-video-2000.m4s', 'duration': 3.0},
+                        {'path': 'seg-video-5000.m4s', 'duration': 3.0},
+                        {'path': 'seg-video-8000.m4s', 'duration': 3.0},
+                    ],
+                }],
+                {},
             )
         ]
 
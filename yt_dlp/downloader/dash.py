@@ -36,18 +36,16 @@ class DashSegmentsFD(FragmentFD):
             self._prepare_and_start_frag_download(ctx, info_dict)
 
         fragments_to_download = []
-        frag_index = 0
-        for i, fragment in enumerate(fragments):
-            frag_index += 1
-            if frag_index <= ctx['fragment_index']:
-                continue
+        # Fragments before ctx['fragment_index'] have already been downloaded
+        start = ctx['fragment_index']
+        for i, fragment in enumerate(fragments[start:], start):
             fragment_url = fragment.get('url')
             if not fragment_url:
                 assert fragment_base_url
                 fragment_url = urljoin(fragment_base_url, fragment['path'])
 
             fragments_to_download.append({
-                'frag_index': frag_index,
+                'frag_index': i + 1,
                 'index': i,
                 'url': fragment_url,
             })
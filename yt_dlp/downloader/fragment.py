@@ -414,10 +414,10 @@ class FragmentFD(FileDownloader):
 
         def download_fragment(fragment, ctx):
             frag_index = ctx['fragment_index'] = fragment['frag_index']
-            headers = info_dict.get('http_headers', {}).copy()
+            headers = info_dict.get('http_headers', {})
             byte_range = fragment.get('byte_range')
             if byte_range:
-                headers['Range'] = 'bytes=%d-%d' % (byte_range['start'], byte_range['end'] - 1)
+                headers = dict(headers, Range='bytes=%d-%d' % (byte_range['start'], byte_range['end'] - 1))
 
             # Never skip the first fragment
             fatal = is_fatal(fragment.get('index') or (frag_index - 1))
@@ -20,6 +20,12 @@ from ..utils import (
 from .. import webvtt
 
 
+_DRM_RE = re.compile('|'.join([
+    r'#EXT-X-FAXS-CM:',  # Adobe Flash Access
+    r'#EXT-X-(?:SESSION-)?KEY:.*?URI="skd://',  # Apple FairPlay
+]))
+
+
 class HlsFD(FragmentFD):
     """
     Download segments in a m3u8 manifest. External downloaders can take over
@@ -77,10 +83,7 @@ class HlsFD(FragmentFD):
                 message = ('The stream has AES-128 encryption and neither ffmpeg nor pycryptodomex are available; '
                            'Decryption will be performed natively, but will be extremely slow')
         if not can_download:
-            has_drm = re.search('|'.join([
-                r'#EXT-X-FAXS-CM:',  # Adobe Flash Access
-                r'#EXT-X-(?:SESSION-)?KEY:.*?URI="skd://',  # Apple FairPlay
-            ]), s)
+            has_drm = _DRM_RE.search(s)
             if has_drm and not self.params.get('allow_unplayable_formats'):
                 self.report_error(
                     'This video is DRM protected; Try selecting another format with --format or '
@@ -114,14 +117,12 @@ class HlsFD(FragmentFD):
                     or s.startswith('#UPLYNK-SEGMENT') and s.endswith(',segment'))
 
         fragments = []
+        lines = [line for line in map(str.strip, s.splitlines()) if line]
 
         media_frags = 0
         ad_frags = 0
         ad_frag_next = False
-        for line in s.splitlines():
-            line = line.strip()
-            if not line:
-                continue
+        for line in lines:
             if line.startswith('#'):
                 if is_ad_fragment_start(line):
                     ad_frag_next = True
@@ -151,103 +152,99 @@ class HlsFD(FragmentFD):
         extra_param_to_segment_url = info_dict.get('extra_param_to_segment_url')
         if extra_param_to_segment_url:
             extra_query = compat_urlparse.parse_qs(extra_param_to_segment_url)
-        i = 0
         media_sequence = 0
         decrypt_info = {'METHOD': 'NONE'}
         byte_range = {}
         discontinuity_count = 0
         frag_index = 0
         ad_frag_next = False
-        for line in s.splitlines():
-            line = line.strip()
-            if line:
-                if not line.startswith('#'):
-                    if format_index and discontinuity_count != format_index:
-                        continue
-                    if ad_frag_next:
-                        continue
-                    frag_index += 1
-                    if frag_index <= ctx['fragment_index']:
-                        continue
-                    frag_url = (
-                        line
-                        if re.match(r'^https?://', line)
-                        else compat_urlparse.urljoin(man_url, line))
-                    if extra_query:
-                        frag_url = update_url_query(frag_url, extra_query)
-
-                    fragments.append({
-                        'frag_index': frag_index,
-                        'url': frag_url,
-                        'decrypt_info': decrypt_info,
-                        'byte_range': byte_range,
-                        'media_sequence': media_sequence,
-                    })
-                    media_sequence += 1
-
-                elif line.startswith('#EXT-X-MAP'):
-                    if format_index and discontinuity_count != format_index:
-                        continue
-                    if frag_index > 0:
-                        self.report_error(
-                            'Initialization fragment found after media fragments, unable to download')
-                        return False
-                    frag_index += 1
-                    map_info = parse_m3u8_attributes(line[11:])
-                    frag_url = (
-                        map_info.get('URI')
-                        if re.match(r'^https?://', map_info.get('URI'))
-                        else compat_urlparse.urljoin(man_url, map_info.get('URI')))
-                    if extra_query:
-                        frag_url = update_url_query(frag_url, extra_query)
-
-                    fragments.append({
-                        'frag_index': frag_index,
-                        'url': frag_url,
-                        'decrypt_info': decrypt_info,
-                        'byte_range': byte_range,
-                        'media_sequence': media_sequence
-                    })
-                    media_sequence += 1
-
-                    if map_info.get('BYTERANGE'):
-                        splitted_byte_range = map_info.get('BYTERANGE').split('@')
-                        sub_range_start = int(splitted_byte_range[1]) if len(splitted_byte_range) == 2 else byte_range['end']
-                        byte_range = {
-                            'start': sub_range_start,
-                            'end': sub_range_start + int(splitted_byte_range[0]),
-                        }
-
-                elif line.startswith('#EXT-X-KEY'):
-                    decrypt_url = decrypt_info.get('URI')
-                    decrypt_info = parse_m3u8_attributes(line[11:])
-                    if decrypt_info['METHOD'] == 'AES-128':
-                        if 'IV' in decrypt_info:
-                            decrypt_info['IV'] = binascii.unhexlify(decrypt_info['IV'][2:].zfill(32))
-                        if not re.match(r'^https?://', decrypt_info['URI']):
-                            decrypt_info['URI'] = compat_urlparse.urljoin(
-                                man_url, decrypt_info['URI'])
-                        if extra_query:
-                            decrypt_info['URI'] = update_url_query(decrypt_info['URI'], extra_query)
-                        if decrypt_url != decrypt_info['URI']:
-                            decrypt_info['KEY'] = None
-
-                elif line.startswith('#EXT-X-MEDIA-SEQUENCE'):
-                    media_sequence = int(line[22:])
-                elif line.startswith('#EXT-X-BYTERANGE'):
-                    splitted_byte_range = line[17:].split('@')
+        for line in lines:
+            if not line.startswith('#'):
+                if format_index and discontinuity_count != format_index:
+                    continue
+                if ad_frag_next:
+                    continue
+                frag_index += 1
+                if frag_index <= ctx['fragment_index']:
+                    continue
+                frag_url = (
+                    line
+                    if line.startswith(('http://', 'https://'))
+                    else compat_urlparse.urljoin(man_url, line))
+                if extra_query:
+                    frag_url = update_url_query(frag_url, extra_query)
+
+                fragments.append({
+                    'frag_index': frag_index,
+                    'url': frag_url,
+                    'decrypt_info': decrypt_info,
+                    'byte_range': byte_range,
+                    'media_sequence': media_sequence,
+                })
+                media_sequence += 1
+
+            elif line.startswith('#EXT-X-MAP'):
+                if format_index and discontinuity_count != format_index:
+                    continue
+                if frag_index > 0:
+                    self.report_error(
+                        'Initialization fragment found after media fragments, unable to download')
+                    return False
+                frag_index += 1
+                map_info = parse_m3u8_attributes(line[11:])
+                frag_url = (
+                    map_info.get('URI')
+                    if map_info.get('URI').startswith(('http://', 'https://'))
+                    else compat_urlparse.urljoin(man_url, map_info.get('URI')))
+                if extra_query:
+                    frag_url = update_url_query(frag_url, extra_query)
+
+                fragments.append({
+                    'frag_index': frag_index,
+                    'url': frag_url,
+                    'decrypt_info': decrypt_info,
+                    'byte_range': byte_range,
+                    'media_sequence': media_sequence
+                })
+                media_sequence += 1
+
+                if map_info.get('BYTERANGE'):
+                    splitted_byte_range = map_info.get('BYTERANGE').split('@')
                     sub_range_start = int(splitted_byte_range[1]) if len(splitted_byte_range) == 2 else byte_range['end']
                     byte_range = {
                         'start': sub_range_start,
                         'end': sub_range_start + int(splitted_byte_range[0]),
                     }
-                elif is_ad_fragment_start(line):
-                    ad_frag_next = True
-                elif is_ad_fragment_end(line):
-                    ad_frag_next = False
-                elif line.startswith('#EXT-X-DISCONTINUITY'):
-                    discontinuity_count += 1
-                i += 1
+
+            elif line.startswith('#EXT-X-KEY'):
+                decrypt_url = decrypt_info.get('URI')
+                decrypt_info = parse_m3u8_attributes(line[11:])
+                if decrypt_info['METHOD'] == 'AES-128':
+                    if 'IV' in decrypt_info:
+                        decrypt_info['IV'] = binascii.unhexlify(decrypt_info['IV'][2:].zfill(32))
+                    if not decrypt_info['URI'].startswith(('http://', 'https://')):
+                        decrypt_info['URI'] = compat_urlparse.urljoin(
+                            man_url, decrypt_info['URI'])
+                    if extra_query:
+                        decrypt_info['URI'] = update_url_query(decrypt_info['URI'], extra_query)
+                    if decrypt_url != decrypt_info['URI']:
+                        decrypt_info['KEY'] = None
+
+            elif line.startswith('#EXT-X-MEDIA-SEQUENCE'):
+                media_sequence = int(line[22:])
+            elif line.startswith('#EXT-X-BYTERANGE'):
+                splitted_byte_range = line[17:].split('@')
+                sub_range_start = int(splitted_byte_range[1]) if len(splitted_byte_range) == 2 else byte_range['end']
+                byte_range = {
+                    'start': sub_range_start,
+                    'end': sub_range_start + int(splitted_byte_range[0]),
+                }
+            elif is_ad_fragment_start(line):
+                ad_frag_next = True
+            elif is_ad_fragment_end(line):
+                ad_frag_next = False
+            elif line.startswith('#EXT-X-DISCONTINUITY'):
+                discontinuity_count += 1
 
         # We only download the first fragment during the test
         if self.params.get('test', False):
@@ -262,6 +259,12 @@ class HlsFD(FragmentFD):
             return fd.real_download(filename, info_dict)
 
         if is_webvtt:
+            # Deserialized cues of the dedup window, kept in step with the
+            # JSON copies that are persisted in extra_state
+            dedup_blocks = [
+                webvtt.CueBlock.from_json(cue)
+                for cue in extra_state.get('webvtt_dedup_window', [])]
+
             def pack_fragment(frag_content, frag_index):
                 output = io.StringIO()
                 adjust = 0
@@ -284,10 +287,10 @@ class HlsFD(FragmentFD):
                         is_new = True
                         while i < len(dedup_window):
                             wcue = dedup_window[i]
-                            wblock = webvtt.CueBlock.from_json(wcue)
+                            wblock = dedup_blocks[i]
                             i += 1
                             if wblock.hinges(block):
-                                wcue['end'] = block.end
+                                wcue['end'] = wblock.end = block.end
                                 is_new = False
                                 continue
                             if wblock == block:
@@ -298,9 +301,11 @@ class HlsFD(FragmentFD):
                             ready.append(wblock)
                             i -= 1
                             del dedup_window[i]
+                            del dedup_blocks[i]
 
                         if is_new:
                             dedup_window.append(block.as_json)
+                            dedup_blocks.append(block)
                         for block in ready:
                             block.write_into(output)
 
@@ -342,13 +347,12 @@ class HlsFD(FragmentFD):
                 return output.getvalue().encode('utf-8')
 
             def fin_fragments():
-                dedup_window = extra_state.get('webvtt_dedup_window')
-                if not dedup_window:
+                if not dedup_blocks:
                     return b''
 
                 output = io.StringIO()
-                for cue in dedup_window:
-                    webvtt.CueBlock.from_json(cue).write_into(output)
+                for block in dedup_blocks:
+                    block.write_into(output)
 
                 return output.getvalue().encode('utf-8')
 
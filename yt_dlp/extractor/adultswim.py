@@ -90,13 +90,8 @@ class AdultSwimIE(TurnerBaseIE):
     def _real_extract(self, url):
         show_path, episode_path = self._match_valid_url(url).groups()
         display_id = episode_path or show_path
-        query = '''query {
-  getShowBySlug(slug:"%s") {
-    %%s
-  }
-}''' % show_path
         if episode_path:
-            query = query % '''title
+            show_fields = '''title
     getVideoBySlug(slug:"%s") {
       _id
       auth
@@ -110,9 +105,8 @@ class AdultSwimIE(TurnerBaseIE):
       title
       tvRating
     }''' % episode_path
-            ['getVideoBySlug']
         else:
-            query = query % '''metaDescription
+            show_fields = '''metaDescription
     title
     videos(first:1000,sort:["episode_number"]) {
       edges {
@@ -122,6 +116,11 @@ class AdultSwimIE(TurnerBaseIE):
         }
       }
     }'''
+        query = '''query {
+  getShowBySlug(slug:"%s") {
+    %s
+  }
+}''' % (show_path, show_fields)
         show_data = self._download_json(
             'https://www.adultswim.com/api/search', display_id,
             data=json.dumps({'query': query}).encode(),
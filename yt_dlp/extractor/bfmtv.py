@@ -10,7 +10,7 @@ from ..utils import extract_attributes
 class BFMTVBaseIE(InfoExtractor):
     _VALID_URL_BASE = r'https?://(?:www\.)?bfmtv\.com/'
     _VALID_URL_TMPL = _VALID_URL_BASE + r'(?:[^/]+/)*[^/?&#]+_%s[A-Z]-(?P<id>\d{12})\.html'
-    _VIDEO_BLOCK_REGEX = r'(<div[^>]+class="video_block"[^>]*>)'
+    _VIDEO_BLOCK_REGEX = re.compile(r'(<div[^>]+class="video_block"[^>]*>)')
     BRIGHTCOVE_URL_TEMPLATE = 'http://players.brightcove.net/%s/%s_default/index.html?videoId=%s'
 
     def _brightcove_url_result(self, video_id, video_block):
@@ -91,8 +91,8 @@ class BFMTVArticleIE(BFMTVBaseIE):
         webpage = self._download_webpage(url, bfmtv_id)
 
         entries = []
-        for video_block_el in re.findall(self._VIDEO_BLOCK_REGEX, webpage):
-            video_block = extract_attributes(video_block_el)
+        for mobj in self._VIDEO_BLOCK_REGEX.finditer(webpage):
+            video_block = extract_attributes(mobj.group(1))
             video_id = video_block.get('videoid')
             if not video_id:
                 continue
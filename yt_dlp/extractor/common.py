@@ -2,7 +2,6 @@
 from __future__ import unicode_literals
 
 import base64
-import collections
 import datetime
 import hashlib
 import itertools
@@ -91,6 +90,10 @@ from ..utils import (
 )
 
 
+# Matches the % characters and $...$ identifiers of MPD segment templates
+_MPD_TEMPLATE_RE = re.compile(r'%|\$(?P<name>[^$]*)(?P<end>\$?)')
+
+
 class InfoExtractor(object):
     """Information Extractor class.
 
@@ -2620,8 +2623,15 @@ class InfoExtractor(object):
 
         namespace = self._search_regex(r'(?i)^{([^}]+)?}MPD$', mpd_doc.tag, 'namespace', default=None)
 
+        # The same handful of tags is looked up for every element of the manifest,
+        # so build each namespaced path only once
+        ns_paths = {}
+
         def _add_ns(path):
-            return self._xpath_ns(path, namespace)
+            ns_path = ns_paths.get(path)
+            if ns_path is None:
+                ns_path = ns_paths[path] = self._xpath_ns(path, namespace)
+            return ns_path
 
         def is_drm_protected(element):
             return element.find(_add_ns('ContentProtection')) is not None
@@ -2684,22 +2694,34 @@ class InfoExtractor(object):
                         extract_Initialization(segment_template)
             return ms_info
 
+        def get_base_url(element):
+            base_url_e = element.find(_add_ns('BaseURL'))
+            return base_url_e.text if base_url_e is not None else None
+
+        if mpd_base_url and not mpd_base_url.endswith('/'):
+            mpd_base_url += '/'
+
         mpd_duration = parse_duration(mpd_doc.get('mediaPresentationDuration'))
+        # BaseURL of the enclosing elements is the same for all of their children
+        mpd_doc_base_url = get_base_url(mpd_doc)
         formats, subtitles = [], {}
-        stream_numbers = collections.defaultdict(int)
+        stream_numbers = {}
         for period in mpd_doc.findall(_add_ns('Period')):
             period_duration = parse_duration(period.get('duration')) or mpd_duration
+            period_base_url = get_base_url(period)
             period_ms_info = extract_multisegment_info(period, {
                 'start_number': 1,
                 'timescale': 1,
             })
             for adaptation_set in period.findall(_add_ns('AdaptationSet')):
                 adaption_set_ms_info = extract_multisegment_info(adaptation_set, period_ms_info)
+                adaptation_set_base_url = get_base_url(adaptation_set)
                 for representation in adaptation_set.findall(_add_ns('Representation')):
                     representation_attrib = adaptation_set.attrib.copy()
                     representation_attrib.update(representation.attrib)
                     # According to [1, 5.3.7.2, Table 9, page 41], @mimeType is mandatory
                     mime_type = representation_attrib['mimeType']
+                    ext = mimetype2ext(mime_type)
                     content_type = representation_attrib.get('contentType', mime_type.split('/')[0])
 
                     codecs = representation_attrib.get('codecs', '')
@@ -2708,28 +2730,27 @@ class InfoExtractor(object):
                             content_type = mime_type
                         elif codecs.split('.')[0] == 'stpp':
                             content_type = 'text'
-                        elif mimetype2ext(mime_type) in ('tt', 'dfxp', 'ttml', 'xml', 'json'):
+                        elif ext in ('tt', 'dfxp', 'ttml', 'xml', 'json'):
                             content_type = 'text'
                         else:
                             self.report_warning('Unknown MIME type %s in DASH manifest' % mime_type)
                             continue
 
+                    url_el = representation.find(_add_ns('BaseURL'))
                     base_url = ''
-                    for element in (representation, adaptation_set, period, mpd_doc):
-                        base_url_e = element.find(_add_ns('BaseURL'))
-                        if base_url_e is not None:
-                            base_url = base_url_e.text + base_url
-                            if re.match(r'^https?://', base_url):
+                    for base_url_part in (
+                            url_el.text if url_el is not None else None,
+                            adaptation_set_base_url, period_base_url, mpd_doc_base_url):
+                        if base_url_part:
+                            base_url = base_url_part + base_url
+                            if base_url.startswith(('http://', 'https://')):
                                 break
                     if mpd_base_url and base_url.startswith('/'):
                         base_url = compat_urlparse.urljoin(mpd_base_url, base_url)
-                    elif mpd_base_url and not re.match(r'^https?://', base_url):
-                        if not mpd_base_url.endswith('/'):
-                            mpd_base_url += '/'
+                    elif mpd_base_url and not base_url.startswith(('http://', 'https://')):
                         base_url = mpd_base_url + base_url
                     representation_id = representation_attrib.get('id')
                     lang = representation_attrib.get('lang')
-                    url_el = representation.find(_add_ns('BaseURL'))
                     filesize = int_or_none(url_el.attrib.get('{http://youtube.com/yt/2012/10/10}contentLength') if url_el is not None else None)
                     bandwidth = int_or_none(representation_attrib.get('bandwidth'))
                     if representation_id is not None:
@@ -2742,7 +2763,7 @@ class InfoExtractor(object):
                         f = {
                             'format_id': format_id,
                             'manifest_url': mpd_url,
-                            'ext': mimetype2ext(mime_type),
+                            'ext': ext,
                             'width': int_or_none(representation_attrib.get('width')),
                             'height': int_or_none(representation_attrib.get('height')),
                             'tbr': float_or_none(bandwidth, 1000),
@@ -2751,12 +2772,12 @@ class InfoExtractor(object):
                             'language': lang if lang not in ('mul', 'und', 'zxx', 'mis') else None,
                             'format_note': 'DASH %s' % content_type,
                             'filesize': filesize,
-                            'container': mimetype2ext(mime_type) + '_dash',
+                            'container': ext + '_dash',
                         }
                         f.update(parse_codecs(codecs))
                     elif content_type == 'text':
                         f = {
-                            'ext': mimetype2ext(mime_type),
+                            'ext': ext,
                             'manifest_url': mpd_url,
                             'filesize': filesize,
                         }
@@ -2776,27 +2797,27 @@ class InfoExtractor(object):
                     representation_ms_info = extract_multisegment_info(representation, adaption_set_ms_info)
 
                     def prepare_template(template_name, identifiers):
-                        tmpl = representation_ms_info[template_name]
                         # First of, % characters outside $...$ templates
                         # must be escaped by doubling for proper processing
                         # by % operator string formatting used further (see
                         # https://github.com/ytdl-org/youtube-dl/issues/16867).
-                        t = ''
-                        in_template = False
-                        for c in tmpl:
-                            t += c
-                            if c == '$':
-                                in_template = not in_template
-                            elif c == '%' and not in_template:
-                                t += c
                         # Next, $...$ templates are translated to their
-                        # %(...) counterparts to be used with % operator
-                        if representation_id is not None:
-                            t = t.replace('$RepresentationID$', representation_id)
-                        t = re.sub(r'\$(%s)\$' % '|'.join(identifiers), r'%(\1)d', t)
-                        t = re.sub(r'\$(%s)%%([^$]+)\$' % '|'.join(identifiers), r'%(\1)\2', t)
-                        t.replace('$$', '$')
-                        return t
+                        # %(...) counterparts to be used with % operator.
+                        # Both are done in a single pass over the template
+                        def translate(mobj):
+                            if mobj.group(0) == '%':
+                                return '%%'
+                            elif not mobj.group('end'):
+                                return mobj.group(0)
+                            name = mobj.group('name')
+                            if name == 'RepresentationID' and representation_id is not None:
+                                return representation_id
+                            identifier, _, fmt = name.partition('%')
+                            if identifier not in identifiers:
+                                return mobj.group(0)
+                            return '%%(%s)%s' % (identifier, fmt or 'd')
+
+                        return _MPD_TEMPLATE_RE.sub(translate, representation_ms_info[template_name])
 
                     # @initialization is a regular template like @media one
                     # so it should be handled just the same way (see
@@ -2813,7 +2834,7 @@ class InfoExtractor(object):
                         }
 
                     def location_key(location):
-                        return 'url' if re.match(r'^https?://', location) else 'path'
+                        return 'url' if location.startswith(('http://', 'https://')) else 'path'
 
                     if 'segment_urls' not in representation_ms_info and 'media' in representation_ms_info:
 
@@ -2827,45 +2848,42 @@ class InfoExtractor(object):
                             if 'total_number' not in representation_ms_info and 'segment_duration' in representation_ms_info:
                                 segment_duration = float_or_none(representation_ms_info['segment_duration'], representation_ms_info['timescale'])
                                 representation_ms_info['total_number'] = int(math.ceil(float(period_duration) / segment_duration))
-                            representation_ms_info['fragments'] = [{
-                                media_location_key: media_template % {
-                                    'Number': segment_number,
-                                    'Bandwidth': bandwidth,
-                                },
-                                'duration': segment_duration,
-                            } for segment_number in range(
-                                representation_ms_info['start_number'],
-                                representation_ms_info['total_number'] + representation_ms_info['start_number'])]
+                            # Only $Number$ changes between segments, so the
+                            # formatting arguments are built once and updated in place
+                            template_args = {'Bandwidth': bandwidth}
+                            fragments = representation_ms_info['fragments'] = []
+                            for segment_number in range(
+                                    representation_ms_info['start_number'],
+                                    representation_ms_info['total_number'] + representation_ms_info['start_number']):
+                                template_args['Number'] = segment_number
+                                fragments.append({
+                                    media_location_key: media_template % template_args,
+                                    'duration': segment_duration,
+                                })
                         else:
                             # $Number*$ or $Time$ in media template with S list available
                             # Example $Number*$: http://www.svtplay.se/klipp/9023742/stopptid-om-bjorn-borg
                             # Example $Time$: https://play.arkena.com/embed/avp/v2/player/media/b41dda37-d8e7-4d3f-b1b5-9a9db578bdfe/1/129411
-                            representation_ms_info['fragments'] = []
+                            timescale = representation_ms_info['timescale']
+                            template_args = {'Bandwidth': bandwidth}
+                            fragments = representation_ms_info['fragments'] = []
                             segment_time = 0
-                            segment_d = None
                             segment_number = representation_ms_info['start_number']
-
-                            def add_segment_url():
-                                segment_url = media_template % {
-                                    'Time': segment_time,
-                                    'Bandwidth': bandwidth,
-                                    'Number': segment_number,
-                                }
-                                representation_ms_info['fragments'].append({
-                                    media_location_key: segment_url,
-                                    'duration': float_or_none(segment_d, representation_ms_info['timescale']),
-                                })
-
-                            for num, s in enumerate(representation_ms_info['s']):
+                            for s in representation_ms_info['s']:
                                 segment_time = s.get('t') or segment_time
                                 segment_d = s['d']
-                                add_segment_url()
-                                segment_number += 1
-                                for r in range(s.get('r', 0)):
+                                # All repetitions of an S element share its duration
+                                duration = float_or_none(segment_d, timescale)
+                                # A negative r (repeat until the next S) still yields one segment
+                                for _ in range(max(s.get('r', 0), 0) + 1):
+                                    template_args['Time'] = segment_time
+                                    template_args['Number'] = segment_number
+                                    fragments.append({
+                                        media_location_key: media_template % template_args,
+                                        'duration': duration,
+                                    })
                                     segment_time += segment_d
-                                    add_segment_url()
                                     segment_number += 1
-                                segment_time += segment_d
                     elif 'segment_urls' in representation_ms_info and 's' in representation_ms_info:
                         # No media template
                         # Example: https://www.youtube.com/watch?v=iXZV5uAYMJI
@@ -2921,8 +2939,8 @@ class InfoExtractor(object):
                         # Assuming direct URL to unfragmented media.
                         f['url'] = base_url
                     if content_type in ('video', 'audio', 'image/jpeg'):
-                        f['manifest_stream_number'] = stream_numbers[f['url']]
-                        stream_numbers[f['url']] += 1
+                        stream_number = f['manifest_stream_number'] = stream_numbers.get(f['url'], 0)
+                        stream_numbers[f['url']] = stream_number + 1
                         formats.append(f)
                     elif content_type == 'text':
                         subtitles.setdefault(lang or 'und', []).append(f)
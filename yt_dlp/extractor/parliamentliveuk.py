@@ -5,7 +5,9 @@ import json
 import uuid
 
 from .common import InfoExtractor
+from ..compat import compat_HTTPError
 from ..utils import (
+    ExtractorError,
     unified_timestamp,
     try_get,
 )
@@ -30,20 +32,20 @@ class ParliamentLiveUKIE(InfoExtractor):
         'only_matching': True,
     }]
 
-    def _real_extract(self, url):
-        video_id = self._match_id(url)
-        video_info = self._download_json(f'https://www.parliamentlive.tv/Event/GetShareVideo/{video_id}', video_id)
-        _DEVICE_ID = str(uuid.uuid4())
-        auth = 'Bearer ' + self._download_json(
+    _AUTH = None
+
+    def _get_auth(self, video_id):
+        device_id = str(uuid.uuid4())
+        return 'Bearer ' + self._download_json(
             'https://exposure.api.redbee.live/v2/customer/UKParliament/businessunit/ParliamentLive/auth/anonymous',
-            video_id, headers={
+            video_id, 'Downloading session token', headers={
                 'Origin': 'https://videoplayback.parliamentlive.tv',
                 'Accept': 'application/json, text/plain, */*',
                 'Content-Type': 'application/json;charset=utf-8'
             }, data=json.dumps({
-                'deviceId': _DEVICE_ID,
+                'deviceId': device_id,
                 'device': {
-                    'deviceId': _DEVICE_ID,
+                    'deviceId': device_id,
                     'width': 653,
                     'height': 368,
                     'type': 'WEB',
@@ -51,9 +53,25 @@ class ParliamentLiveUKIE(InfoExtractor):
                 }
             }).encode('utf-8'))['sessionToken']
 
-        video_urls = self._download_json(
+    def _download_video_urls(self, video_id):
+        return self._download_json(
             f'https://exposure.api.redbee.live/v2/customer/UKParliament/businessunit/ParliamentLive/entitlement/{video_id}/play',
-            video_id, headers={'Authorization': auth, 'Accept': 'application/json, text/plain, */*'})['formats']
+            video_id, headers={'Authorization': self._AUTH, 'Accept': 'application/json, text/plain, */*'})['formats']
+
+    def _real_extract(self, url):
+        video_id = self._match_id(url)
+        video_info = self._download_json(f'https://www.parliamentlive.tv/Event/GetShareVideo/{video_id}', video_id)
+
+        # The anonymous session token is reused for all videos until it is rejected
+        if not self._AUTH:
+            self._AUTH = self._get_auth(video_id)
+        try:
+            video_urls = self._download_video_urls(video_id)
+        except ExtractorError as e:
+            if not isinstance(e.cause, compat_HTTPError) or e.cause.code != 401:
+                raise
+            self._AUTH = self._get_auth(video_id)
+            video_urls = self._download_video_urls(video_id)
 
         formats = []
         for format in video_urls:
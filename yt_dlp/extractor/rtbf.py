@@ -66,6 +66,7 @@ class RTBFIE(InfoExtractor):
         ('web', 'MD'),
         ('high', 'HD'),
     ]
+    _HEIGHT_RE = re.compile(r'-(\d+)p\.')
 
     def _real_extract(self, url):
         live, media_id = self._match_valid_url(url).groups()
@@ -87,7 +88,6 @@ class RTBFIE(InfoExtractor):
         is_live = data.get('isLive')
         if is_live:
             title = self._live_title(title)
-        height_re = r'-(\d+)p\.'
         formats = []
 
         m3u8_url = data.get('urlHlsAes128') or data.get('urlHls')
@@ -97,7 +97,7 @@ class RTBFIE(InfoExtractor):
 
         fix_url = lambda x: x.replace('//rtbf-vod.', '//rtbf.') if '/geo/drm/' in x else x
         http_url = data.get('url')
-        if formats and http_url and re.search(height_re, http_url):
+        if formats and http_url and self._HEIGHT_RE.search(http_url):
             http_url = fix_url(http_url)
             for m3u8_f in formats[:]:
                 height = m3u8_f.get('height')
@@ -107,7 +107,7 @@ class RTBFIE(InfoExtractor):
                 del f['protocol']
                 f.update({
                     'format_id': m3u8_f['format_id'].replace('hls-', 'http-'),
-                    'url': re.sub(height_re, '-%dp.' % height, http_url),
+                    'url': self._HEIGHT_RE.sub('-%dp.' % height, http_url),
                 })
                 formats.append(f)
         else:
@@ -117,7 +117,7 @@ class RTBFIE(InfoExtractor):
                 if not format_url:
                     continue
                 height = int_or_none(self._search_regex(
-                    height_re, format_url, 'height', default=None))
+                    self._HEIGHT_RE, format_url, 'height', default=None))
                 formats.append({
                     'format_id': format_id,
                     'url': fix_url(format_url),
@@ -116,6 +116,7 @@ class WeiboMobileIE(InfoExtractor):
             'uploader': '柴犬柴犬'
         }
     }
+    _RENDER_DATA_RE = re.compile(r'var\s+\$render_data\s*=\s*\[({.*})\]\[0\]\s*\|\|\s*{};', re.DOTALL)
 
     def _real_extract(self, url):
         video_id = self._match_id(url)
@@ -123,8 +124,7 @@ class WeiboMobileIE(InfoExtractor):
         webpage = self._download_webpage(url, video_id, note='visit the page')
 
         weibo_info = self._parse_json(self._search_regex(
-            r'var\s+\$render_data\s*=\s*\[({.*})\]\[0\]\s*\|\|\s*{};',
-            webpage, 'js_code', flags=re.DOTALL),
+            self._RENDER_DATA_RE, webpage, 'js_code'),
             video_id, transform_source=js_to_json)
 
         status_data = weibo_info.get('status', {})
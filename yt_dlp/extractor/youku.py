@@ -120,25 +120,26 @@ class YoukuIE(InfoExtractor):
         'only_matching': True,
     }]
 
+    _FORMAT_NAMES = {
+        '3gp': 'h6',
+        '3gphd': 'h5',
+        'flv': 'h4',
+        'flvhd': 'h4',
+        'mp4': 'h3',
+        'mp4hd': 'h3',
+        'mp4hd2': 'h4',
+        'mp4hd3': 'h4',
+        'hd2': 'h2',
+        'hd3': 'h1',
+    }
+
     @staticmethod
     def get_ysuid():
         return '%d%s' % (int(time.time()), ''.join([
             random.choice(string.ascii_letters) for i in range(3)]))
 
     def get_format_name(self, fm):
-        _dict = {
-            '3gp': 'h6',
-            '3gphd': 'h5',
-            'flv': 'h4',
-            'flvhd': 'h4',
-            'mp4': 'h3',
-            'mp4hd': 'h3',
-            'mp4hd2': 'h4',
-            'mp4hd3': 'h4',
-            'hd2': 'h2',
-            'hd3': 'h1',
-        }
-        return _dict.get(fm)
+        return self._FORMAT_NAMES.get(fm)
 
     def _real_extract(self, url):
         video_id = self._match_id(url)
@@ -250,6 +251,8 @@ class YoukuShowIE(InfoExtractor):
         'url': 'http://list.youku.com/show/id_z20eb4acaf5c211e3b2ad.html',
         'only_matching': True,
     }]
+    _EPISODE_URL_RE = re.compile(r'<a[^>]+href="([^"]+)"')
+    _RELOAD_ID_RE = re.compile(r'<li[^>]+data-id="([^"]+)">')
 
     def _extract_entries(self, playlist_data_url, show_id, note, query):
         query['callback'] = 'cb'
@@ -262,7 +265,7 @@ class YoukuShowIE(InfoExtractor):
                       or get_element_by_class('p-drama-half-row', playlist_data))
         if drama_list is None:
             raise ExtractorError('No episodes found')
-        video_urls = re.findall(r'<a[^>]+href="([^"]+)"', drama_list)
+        video_urls = self._EPISODE_URL_RE.findall(drama_list)
         return playlist_data, [
             self.url_result(self._proto_relative_url(video_url, 'http:'), YoukuIE.ie_key())
             for video_url in video_urls]
@@ -285,7 +288,7 @@ class YoukuShowIE(InfoExtractor):
         first_page_reload_id = self._html_search_regex(
             r'<div[^>]+id="(reload_\d+)', first_page, 'first page reload id')
         # The first reload_id has the same items as first_page
-        reload_ids = re.findall('<li[^>]+data-id="([^"]+)">', first_page)
+        reload_ids = self._RELOAD_ID_RE.findall(first_page)
         entries.extend(initial_entries)
         for idx, reload_id in enumerate(reload_ids):
             if reload_id == first_page_reload_id:
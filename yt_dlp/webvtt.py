@@ -333,7 +333,9 @@ class CueBlock(Block):
         }
 
     def __eq__(self, other):
-        return self.as_json == other.as_json
+        return (self.start == other.start and self.end == other.end
+                and self.text == other.text and self.settings == other.settings
+                and self.id == other.id)
 
     @classmethod
     def from_json(cls, json):